@@ -1,13 +1,42 @@
 import logging
+from collections import namedtuple
 from typing import Dict, Optional, Any, List
 import hyperliquid
+import requests
 
 import eth_account
 from eth_account.signers.local import LocalAccount
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from hyperliquid.exchange import Exchange
 from hyperliquid.info import Info
 from hyperliquid.utils import constants
 
+# Live exchange handles produced by a successful connect
+ConnectionContext = namedtuple("ConnectionContext", ["exchange", "info", "wallet_address"])
+
+# Keep-alive pool sizing for the SDK's HTTP sessions
+POOL_CONNECTIONS = 4
+POOL_MAXSIZE = 32
+
+def _pooled_session() -> requests.Session:
+    """
+    Build a keep-alive requests session to share between the SDK clients
+    
+    Only connection errors are retried: a POST that reached the exchange may
+    already have placed or cancelled an order, so it must not be resent.
+    
+    Returns:
+        Session with a widened connection pool mounted for https
+    """
+    session = requests.Session()
+    session.headers.update({"Content-Type": "application/json"})
+    retry = Retry(total=2, connect=2, read=0, status=0, backoff_factor=0.1)
+    session.mount("https://", HTTPAdapter(pool_connections=POOL_CONNECTIONS,
+                                          pool_maxsize=POOL_MAXSIZE,
+                                          max_retries=retry))
+    return session
+
 class ApiConnector:
     """Handles connections to trading APIs and exchanges"""
     
@@ -19,7 +48,7 @@ class ApiConnector:
         self.info: Optional[Info] = None
         
     def connect_hyperliquid(self, wallet_address: str, secret_key: str, 
-                           use_testnet: bool = False) -> bool:
+                           use_testnet: bool = False) -> Optional[ConnectionContext]:
         """
         Connect to Hyperliquid exchange
         
@@ -29,7 +58,7 @@ class ApiConnector:
             use_testnet: Whether to use testnet (default is mainnet)
             
         Returns:
-            True if connected successfully, False otherwise
+            ConnectionContext if connected successfully, None otherwise
         """
         try:
             self.wallet_address = wallet_address
@@ -46,14 +75,20 @@ class ApiConnector:
             )
             self.info = Info(api_url)
             
+            # All three clients talk to the same host, so give them one pooled
+            # session; the balance check below then warms it for the first order
+            session = _pooled_session()
+            for client in (self.exchange, self.exchange.info, self.info):
+                client.session = session
+            
             # Test connection by getting balances
             user_state = self.info.user_state(self.wallet_address)
             
-            self.logger.info(f"Successfully connected to Hyperliquid {'(testnet)' if use_testnet else ''}")
-            return True
+            self.logger.info("Successfully connected to Hyperliquid %s", "(testnet)" if use_testnet else "(mainnet)")
+            return ConnectionContext(self.exchange, self.info, self.wallet_address)
         except Exception as e:
-            self.logger.error(f"Error connecting to Hyperliquid: {str(e)}")
-            return False
+            self.logger.error("Error connecting to Hyperliquid: %s", e)
+            return None
     
     def get_balances(self) -> Dict[str, Any]:
         """Get all balances (spot and perpetual)"""
@@ -88,7 +123,7 @@ class ApiConnector:
                 "perp": perp_balances
             }
         except Exception as e:
-            self.logger.error(f"Error fetching balances: {str(e)}")
+            self.logger.error("Error fetching balances: %s", e)
             return {"spot": [], "perp": {}}
     
     def get_positions(self) -> List[Dict[str, Any]]:
@@ -116,7 +151,7 @@ class ApiConnector:
             
             return positions
         except Exception as e:
-            self.logger.error(f"Error fetching positions: {str(e)}")
+            self.logger.error("Error fetching positions: %s", e)
             return []
     
     def get_market_data(self, symbol: str) -> Dict[str, Any]:
@@ -130,7 +165,7 @@ class ApiConnector:
             Dict with market data including mid_price, best_bid, best_ask
         """
         if not self.info:
-            self.logger.error(f"Not connected to exchange when getting market data for {symbol}")
+            self.logger.error("Not connected to exchange when getting market data for %s", symbol)
             return {}
         
         try:
@@ -154,11 +189,11 @@ class ApiConnector:
                     # Calculate mid price if we have both bid and ask
                     if "best_bid" in market_data and "best_ask" in market_data:
                         market_data["mid_price"] = (market_data["best_bid"] + market_data["best_ask"]) / 2
-                        self.logger.info(f"Got price for {symbol} from order book: {market_data['mid_price']}")
+                        self.logger.info("Got price for %s from order book: %s", symbol, market_data["mid_price"])
                 
                 market_data["order_book"] = order_book
             except Exception as e:
-                self.logger.warning(f"Error getting order book for {symbol}: {str(e)}")
+                self.logger.warning("Error getting order book for %s: %s", symbol, e)
             
             # Method 2: Try all_mids if we don't have mid_price yet
             if "mid_price" not in market_data:
@@ -167,9 +202,9 @@ class ApiConnector:
                     mid_price = all_mids.get(symbol, None)
                     if mid_price is not None:
                         market_data["mid_price"] = float(mid_price)
-                        self.logger.info(f"Got price for {symbol} from all_mids: {market_data['mid_price']}")
+                        self.logger.info("Got price for %s from all_mids: %s", symbol, market_data["mid_price"])
                 except Exception as e:
-                    self.logger.warning(f"Error getting all_mids for {symbol}: {str(e)}")
+                    self.logger.warning("Error getting all_mids for %s: %s", symbol, e)
             
             # Method 3: Try metadata and last price if we still don't have a price
             if "mid_price" not in market_data:
@@ -180,10 +215,10 @@ class ApiConnector:
                             last_price = asset.get("lastPrice")
                             if last_price:
                                 market_data["mid_price"] = float(last_price)
-                                self.logger.info(f"Got price for {symbol} from meta: {market_data['mid_price']}")
+                                self.logger.info("Got price for %s from meta: %s", symbol, market_data["mid_price"])
                                 break
                 except Exception as e:
-                    self.logger.warning(f"Error getting meta for {symbol}: {str(e)}")
+                    self.logger.warning("Error getting meta for %s: %s", symbol, e)
             
             # If we still don't have a price, try symbol info directly
             if "mid_price" not in market_data:
@@ -192,19 +227,19 @@ class ApiConnector:
                         ticker = self.info.ticker(symbol)
                         if ticker and "last" in ticker:
                             market_data["mid_price"] = float(ticker["last"])
-                            self.logger.info(f"Got price for {symbol} from ticker: {market_data['mid_price']}")
+                            self.logger.info("Got price for %s from ticker: %s", symbol, market_data["mid_price"])
                 except Exception as e:
-                    self.logger.warning(f"Error getting ticker for {symbol}: {str(e)}")
+                    self.logger.warning("Error getting ticker for %s: %s", symbol, e)
             
             # Log if we still couldn't get a price
             if "mid_price" not in market_data:
-                self.logger.error(f"Could not determine price for {symbol} using any method")
+                self.logger.error("Could not determine price for %s using any method", symbol)
                 return {"error": f"Could not determine price for {symbol}"}
             
             return market_data
         
         except Exception as e:
-            self.logger.error(f"Error fetching market data for {symbol}: {str(e)}")
+            self.logger.error("Error fetching market data for %s: %s", symbol, e)
             return {"error": str(e)}
     
     def get_open_orders(self, symbol: Optional[str] = None) -> List[Dict[str, Any]]:
@@ -221,7 +256,7 @@ class ApiConnector:
             
             return open_orders
         except Exception as e:
-            self.logger.error(f"Error fetching open orders: {str(e)}")
+            self.logger.error("Error fetching open orders: %s", e)
             return []
     
     def get_trade_history(self, limit: int = 100) -> List[Dict[str, Any]]:
@@ -234,5 +269,5 @@ class ApiConnector:
             fills = self.info.user_fills(self.wallet_address)
             return fills[:limit]
         except Exception as e:
-            self.logger.error(f"Error fetching trade history: {str(e)}")
+            self.logger.error("Error fetching trade history: %s", e)
             return []
\ No newline at end of file
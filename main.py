@@ -1,12 +1,15 @@
 #!/usr/bin/env python3
 
-import os
 import sys
 import logging
 import argparse
 import json
+import socket
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from dotenv import load_dotenv
+from urllib.parse import urlparse
+
+from hyperliquid.utils import constants as hl_constants
 
 # Import other modules
 from api_connector import ApiConnector
@@ -14,23 +17,39 @@ from order_handler import OrderHandler
 from config_manager import ConfigManager
 from terminal_ui import ElysiumTerminalUI
 from strategy_selector import StrategySelector
+from utils import load_env
+
+
+_LOG_FORMATTER = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 
 
 def setup_logging(log_level=logging.INFO, log_file=None):
-    """Configure logging"""
-    log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    """Configure logging (only the first call installs handlers)"""
+    if getattr(setup_logging, "_done", False):
+        return
+    setup_logging._done = True
+    
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(_LOG_FORMATTER)
     logging.basicConfig(
         level=log_level,
-        format=log_format,
-        handlers=[logging.StreamHandler(sys.stdout)]
+        handlers=[stream_handler]
     )
     
     if log_file:
         file_handler = logging.FileHandler(log_file)
-        file_handler.setFormatter(logging.Formatter(log_format))
+        file_handler.setFormatter(_LOG_FORMATTER)
         logging.getLogger().addHandler(file_handler)
 
 
+def prewarm_dns(urls):
+    """Resolve exchange hostnames in the background so connecting doesn't wait on DNS"""
+    executor = ThreadPoolExecutor(max_workers=len(urls))
+    for url in urls:
+        executor.submit(socket.getaddrinfo, urlparse(url).hostname, 443)
+    executor.shutdown(wait=False)
+
+
 def parse_arguments():
     """Parse command line arguments"""
     parser = argparse.ArgumentParser(description='MMMM Trading Platform')
@@ -65,29 +84,29 @@ def emergency_cancel_all(api_connector, order_handler):
             return True
             
         # Cancel all orders
-        logger.info(f"Found {len(open_orders)} open orders, cancelling...")
+        logger.info("Found %d open orders, cancelling...", len(open_orders))
         result = order_handler.cancel_all_orders()
         
         if result.get("status") == "ok":
             logger.info("Successfully cancelled all orders")
             return True
         else:
-            logger.error(f"Failed to cancel all orders: {result.get('message', 'Unknown error')}")
+            logger.error("Failed to cancel all orders: %s", result.get('message', 'Unknown error'))
             return False
             
     except Exception as e:
-        logger.error(f"Error during emergency cancellation: {str(e)}")
+        logger.error("Error during emergency cancellation: %s", e)
         return False
 
 
 def main():
     """Main entry point for the application"""
-    # Load environment variables
-    load_dotenv()
-    
     # Parse command-line arguments
     args = parse_arguments()
     
+    # Start resolving the exchange host while the rest of startup runs
+    prewarm_dns([hl_constants.TESTNET_API_URL if args.testnet else hl_constants.MAINNET_API_URL])
+    
     # Setup logging
     log_level = logging.DEBUG if args.verbose else logging.INFO
     setup_logging(log_level, args.log_file)
@@ -101,22 +120,24 @@ def main():
         api_connector = ApiConnector()
         
         # Get credentials from .env
-        wallet_address = os.getenv("WALLET_ADDRESS")
-        wallet_secret = os.getenv("WALLET_SECRET")
+        env = load_env()
+        wallet_address = env.get("WALLET_ADDRESS")
+        wallet_secret = env.get("WALLET_SECRET")
         
         if not wallet_address or not wallet_secret:
             logger.error("Wallet credentials not found in .env file")
             return 1
             
         # Connect to exchange
-        if not api_connector.connect_hyperliquid(wallet_address, wallet_secret, args.testnet):
+        connection = api_connector.connect_hyperliquid(wallet_address, wallet_secret, args.testnet)
+        if not connection:
             logger.error("Failed to connect to exchange")
             return 1
             
         # Initialize order handler with exchange connection
-        order_handler = OrderHandler(api_connector.exchange, api_connector.info)
+        order_handler = OrderHandler(None, None)
         order_handler.api_connector = api_connector  # Set the api_connector reference
-        order_handler.wallet_address = wallet_address  # Set the wallet address
+        order_handler.attach(connection)
         
         strategy_selector = StrategySelector(api_connector, order_handler, config_manager)
 
@@ -137,10 +158,10 @@ def main():
                     return 1
             
             # Start the specified strategy
-            logger.info(f"Starting strategy: {args.strategy}")
+            logger.info("Starting strategy: %s", args.strategy)
             success = strategy_selector.start_strategy(args.strategy, strategy_params)
             if not success:
-                logger.error(f"Failed to start strategy: {args.strategy}")
+                logger.error("Failed to start strategy: %s", args.strategy)
                 return 1
             
             # Keep the main thread alive while strategy runs
@@ -161,7 +182,7 @@ def main():
     except KeyboardInterrupt:
         logger.info("Shutting down due to keyboard interrupt")
     except Exception as e:
-        logger.error(f"Error in main: {e}", exc_info=True)
+        logger.error("Error in main: %s", e, exc_info=True)
     
     logger.info("MMMM Trading Platform shutdown complete")
 
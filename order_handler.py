@@ -1,28 +1,280 @@
+import heapq
+import itertools
 import logging
+import math
 import threading
-import asyncio
-import json
 import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, Optional, List, Union, Any
+from typing import Dict, Optional, List, Tuple, Any
 
 from hyperliquid.exchange import Exchange
 from hyperliquid.info import Info
 
 
+MAX_COMPLETED_TWAPS = 1000  # Oldest completed TWAPs are dropped beyond this many
+
+# Hyperliquid limit order types by time in force; anything else falls back to GTC
+_TIF_MAP = {
+    "GTC": {"limit": {"tif": "Gtc"}},
+    "IOC": {"limit": {"tif": "Ioc"}},
+    "FOK": {"limit": {"tif": "Fok"}},
+}
+
+# Order side names to the SDK's is_buy flag
+_SIDE_MAP = {"buy": True, "sell": False}
+
+
+class TokenBucket:
+    """Thread-safe token bucket that only blocks once the request budget is spent"""
+    
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last = time.monotonic()
+        self.lock = threading.Lock()
+        
+    def acquire(self, tokens: float = 1) -> None:
+        """
+        Take tokens from the bucket, sleeping only if not enough have accrued
+        
+        Args:
+            tokens: Number of tokens the request costs
+        """
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            if self.tokens < tokens:
+                time.sleep((tokens - self.tokens) / self.rate)
+                self.last = time.monotonic()
+                self.tokens = tokens
+            self.tokens -= tokens
+
+
+class _SliceBatcher:
+    """Coalesces orders submitted within a short window into one bulk order action"""
+    
+    def __init__(self, order_handler, flush_interval: float = 0.05):
+        self.order_handler = order_handler
+        self.flush_interval = flush_interval
+        self.pending = deque()
+        self.lock = threading.Lock()
+        self.thread = None
+        
+    def submit(self, order_request: Dict[str, Any]) -> Future:
+        """
+        Queue an order for the next bulk submission
+        
+        Args:
+            order_request: Order with coin, is_buy, sz, limit_px, order_type and reduce_only keys
+            
+        Returns:
+            Future resolving to the order's result, shaped like a single exchange.order response
+        """
+        future = Future()
+        with self.lock:
+            self.pending.append((order_request, future))
+            if self.thread is None:
+                self.thread = threading.Thread(target=self._run, daemon=True)
+                self.thread.start()
+        return future
+        
+    def _run(self) -> None:
+        """Flush queued orders every interval, exiting once a window passes with nothing queued"""
+        while True:
+            time.sleep(self.flush_interval)
+            with self.lock:
+                batch = list(self.pending)
+                self.pending.clear()
+                if not batch:
+                    self.thread = None
+                    return
+                    
+            # Slices from different TWAPs share the action, so one bad order must not fail the rest
+            results = self.order_handler._bulk_order([order_request for order_request, _ in batch],
+                                                     isolate_failures=True)
+                
+            for i, (_, future) in enumerate(batch):
+                if i < len(results):
+                    future.set_result(results[i])
+                else:
+                    future.set_result({"status": "error", "message": "No status returned for order"})
+
+
+class _TwapScheduler:
+    """Runs the slices of every TWAP from one timer thread and a small worker pool"""
+    
+    def __init__(self, max_workers: int = 4):
+        self.heap = []
+        self.counter = itertools.count()
+        self.cond = threading.Condition()
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="twap")
+        self.thread = None
+        
+    def schedule(self, fire_at: float, twap, slice_num: int) -> None:
+        """
+        Queue a TWAP slice to run at a monotonic time
+        
+        Args:
+            fire_at: time.monotonic() deadline for the slice
+            twap: TwapExecution the slice belongs to
+            slice_num: 1-based slice number
+        """
+        with self.cond:
+            heapq.heappush(self.heap, (fire_at, next(self.counter), twap, slice_num))
+            if self.thread is None:
+                self.thread = threading.Thread(target=self._run, daemon=True)
+                self.thread.start()
+            self.cond.notify()
+            
+    def cancel(self, twap) -> bool:
+        """
+        Drop a TWAP's pending slice
+        
+        Args:
+            twap: TwapExecution to unschedule
+            
+        Returns:
+            bool: True if a pending slice was removed, False if none was queued
+        """
+        with self.cond:
+            remaining = [entry for entry in self.heap if entry[2] is not twap]
+            if len(remaining) == len(self.heap):
+                return False
+            heapq.heapify(remaining)
+            self.heap = remaining
+            self.cond.notify()
+            return True
+            
+    def _run(self) -> None:
+        """Dispatch slices as they come due, exiting once nothing is queued"""
+        while True:
+            with self.cond:
+                while True:
+                    if not self.heap:
+                        self.thread = None
+                        return
+                    delay = self.heap[0][0] - time.monotonic()
+                    if delay <= 0:
+                        _, _, twap, slice_num = heapq.heappop(self.heap)
+                        break
+                    self.cond.wait(timeout=delay)
+                    
+            self.executor.submit(twap._run_slice, slice_num)
+
+
+def order_distribution(total_size: float, num_orders: int, skew: float) -> List[float]:
+    """
+    Split a total size across a ladder of orders
+    
+    Args:
+        total_size: Total order size
+        num_orders: Number of orders to place
+        skew: Skew factor (0 = linear, >0 = exponential)
+        
+    Returns:
+        List of order sizes
+    """
+    if num_orders <= 0:
+        return [total_size]
+        
+    if skew == 0:
+        # Linear distribution - equal sizes
+        return [total_size / num_orders] * num_orders
+        
+    # Exponential distribution based on skew
+    # Higher skew = more weight on earlier orders
+    weights = [pow(i, skew) for i in range(1, num_orders + 1)]
+    scale = total_size / sum(weights)
+    
+    return [weight * scale for weight in weights]
+
+
+def price_levels(num_orders: int, start_price: float, end_price: float) -> List[float]:
+    """
+    Spread prices evenly from start_price to end_price
+    
+    Args:
+        num_orders: Number of orders to place
+        start_price: Price of the first order
+        end_price: Price of the last order
+        
+    Returns:
+        List of prices for each order
+    """
+    if num_orders <= 1:
+        return [start_price]
+        
+    # Price step between orders
+    step = (end_price - start_price) / (num_orders - 1)
+    
+    # Generate price levels
+    return [start_price + (step * i) for i in range(num_orders)]
+
 
 class OrderHandler:
     """Handles all order execution for Elysium Trading Platform"""
     
-    def __init__(self, exchange: Optional[Exchange], info: Optional[Info]):
+    META_TTL = 60  # Seconds before cached exchange metadata is refetched
+    BOOK_MAX_AGE = 0.5  # Seconds a pushed order book stays usable before falling back to REST
+    OPEN_ORDERS_TTL = 0.25  # Seconds open orders are served from cache between signed actions
+    
+    def __init__(self, exchange: Optional[Exchange], info: Optional[Info],
+                 rate_limit: float = 10, rate_burst: float = 20):
         self.exchange = exchange
         self.info = info
         self.wallet_address = None
         self.api_connector = None
         self.logger = logging.getLogger(__name__)
+        self._connected = False
+        
+        # Per-symbol metadata cached from the exchange
+        self._meta_fetched_at = 0.0
+        self._sz_decimals: Dict[str, int] = {}
+        self._is_spot: Dict[str, bool] = {}
+        self._leverage_cache: Dict[str, int] = {}
+        
+        # Latest l2Book pushed over the websocket: symbol -> (book, monotonic receive time)
+        self._book_cache: Dict[str, tuple] = {}
+        self._book_subscriptions = set()
+        
+        # Budget for signed exchange actions (requests per second, burst size)
+        self._rate_limiter = TokenBucket(rate=rate_limit, capacity=rate_burst)
+        
+        # Last open_orders response as (monotonic fetch time, orders)
+        self._open_orders_cache = (0.0, None)
+        self._open_orders_generation = 0
+        self._open_orders_lock = threading.Lock()
+        
+        # Shared by all TWAPs so limit slices that fire together go out as one action
+        self._slice_batcher = _SliceBatcher(self)
+        self._twap_scheduler = _TwapScheduler()
+
+    def attach(self, connection) -> None:
+        """
+        Attach the exchange handles from an ApiConnector connection
+        
+        Args:
+            connection: ConnectionContext returned by ApiConnector.connect_hyperliquid
+        """
+        self.__dict__.update(connection._asdict())
+        self._connected = False
+        self._meta_fetched_at = 0.0
+        self._sz_decimals = {}
+        self._is_spot = {}
+        self._leverage_cache = {}
+        self._book_cache = {}
+        self._book_subscriptions = set()
+        self._open_orders_cache = (0.0, None)
 
     def _check_connection(self):
         """Check if we have a valid exchange connection"""
+        if self._connected:
+            return True
         if not self.exchange or not self.info:
             if self.api_connector and self.api_connector.exchange:
                 self.exchange = self.api_connector.exchange
@@ -30,17 +282,20 @@ class OrderHandler:
             else:
                 self.logger.error("Not connected to exchange")
                 return False
+        self._connected = True
         return True
 
-    # =================================Spot Trading==============================================
-    def market_buy(self, symbol: str, size: float, slippage: float = 0.05) -> Dict[str, Any]:
+    def _market_open(self, symbol: str, is_buy: bool, size: float, slippage: float,
+                     leverage: Optional[int] = None) -> Dict[str, Any]:
         """
-        Execute a market buy order
+        Execute a market order, setting leverage first for perp orders
         
         Args:
             symbol: Trading pair symbol
+            is_buy: True for buy, False for sell
             size: Order size
-            slippage: Maximum acceptable slippage (default 5%)
+            slippage: Maximum acceptable slippage
+            leverage: Leverage multiplier for perp orders, None for spot
             
         Returns:
             Order response dictionary
@@ -48,25 +303,87 @@ class OrderHandler:
         if not self._check_connection():
             return {"status": "error", "message": "Not connected to exchange"}
             
+        action = "market buy" if is_buy else "market sell"
+        if leverage is not None:
+            action = "perp " + action
         try:
-            self.logger.info(f"Executing market buy: {size} {symbol}")
-            result = self.exchange.market_open(symbol, True, size, None, slippage)
+            if leverage is None:
+                self.logger.info("Executing %s: %s %s", action, size, symbol)
+            else:
+                # Set leverage first
+                self._set_leverage(symbol, leverage)
+                self.logger.info("Executing %s: %s %s with %sx leverage", action, size, symbol, leverage)
+                
+            with self._signed_action():
+                result = self.exchange.market_open(symbol, is_buy, size, None, slippage)
             
             if result["status"] == "ok":
                 for status in result["response"]["data"]["statuses"]:
                     if "filled" in status:
                         filled = status["filled"]
-                        self.logger.info(f"Market buy executed: {filled['totalSz']} @ {filled['avgPx']}")
+                        self.logger.info("%s executed: %s @ %s", action.capitalize(), filled['totalSz'], filled['avgPx'])
                     elif "error" in status:
-                        self.logger.error(f"Market buy error: {status['error']}")
+                        self.logger.error("%s error: %s", action.capitalize(), status['error'])
+            if leverage is not None:
+                self._check_perp_result(symbol, result)
             return result
         except Exception as e:
-            self.logger.error(f"Error in market buy: {str(e)}")
+            if leverage is not None:
+                self.invalidate_leverage(symbol)
+            self.logger.error("Error in %s: %s", action, e)
             return {"status": "error", "message": str(e)}
+
+    @contextmanager
+    def _signed_action(self, weight: int = 1):
+        """
+        Wait for rate-limit budget before a signed action and drop cached open orders once it returns
+        
+        Args:
+            weight: Rate-limit weight of the action
+        """
+        self._rate_limiter.acquire(weight)
+        try:
+            yield
+        finally:
+            # Bump the generation so an open-orders read already in flight doesn't re-cache the old book
+            self._open_orders_generation += 1
+            self._open_orders_cache = (0.0, None)
+
+    def _cached_open_orders(self) -> List[Dict[str, Any]]:
+        """
+        Get open orders, reusing a response younger than OPEN_ORDERS_TTL
+        
+        Returns:
+            A new list of open orders for the connected wallet, safe for the caller to modify
+        """
+        with self._open_orders_lock:
+            fetched_at, open_orders = self._open_orders_cache
+            if open_orders is None or time.monotonic() - fetched_at >= self.OPEN_ORDERS_TTL:
+                generation = self._open_orders_generation
+                open_orders = self.info.open_orders(self.wallet_address)
+                if generation == self._open_orders_generation:
+                    self._open_orders_cache = (time.monotonic(), open_orders)
+            # Hand out a copy so a caller sorting or popping can't change what others see
+            return list(open_orders)
+
+    def _iter_open_orders(self, symbol: Optional[str] = None):
+        """
+        Iterate over cached open orders without building a filtered list
+        
+        Args:
+            symbol: Optional trading pair symbol to filter on
             
-    def market_sell(self, symbol: str, size: float, slippage: float = 0.05) -> Dict[str, Any]:
+        Yields:
+            Open order dicts, only those for symbol when one is given
         """
-        Execute a market sell order
+        for order in self._cached_open_orders():
+            if symbol is None or order["coin"] == symbol:
+                yield order
+
+    # =================================Spot Trading==============================================
+    def market_buy(self, symbol: str, size: float, slippage: float = 0.05) -> Dict[str, Any]:
+        """
+        Execute a market buy order
         
         Args:
             symbol: Trading pair symbol
@@ -76,24 +393,21 @@ class OrderHandler:
         Returns:
             Order response dictionary
         """
-        if not self._check_connection():
-            return {"status": "error", "message": "Not connected to exchange"}
+        return self._market_open(symbol, True, size, slippage)
             
-        try:
-            self.logger.info(f"Executing market sell: {size} {symbol}")
-            result = self.exchange.market_open(symbol, False, size, None, slippage)
+    def market_sell(self, symbol: str, size: float, slippage: float = 0.05) -> Dict[str, Any]:
+        """
+        Execute a market sell order
+        
+        Args:
+            symbol: Trading pair symbol
+            size: Order size
+            slippage: Maximum acceptable slippage (default 5%)
             
-            if result["status"] == "ok":
-                for status in result["response"]["data"]["statuses"]:
-                    if "filled" in status:
-                        filled = status["filled"]
-                        self.logger.info(f"Market sell executed: {filled['totalSz']} @ {filled['avgPx']}")
-                    elif "error" in status:
-                        self.logger.error(f"Market sell error: {status['error']}")
-            return result
-        except Exception as e:
-            self.logger.error(f"Error in market sell: {str(e)}")
-            return {"status": "error", "message": str(e)}
+        Returns:
+            Order response dictionary
+        """
+        return self._market_open(symbol, False, size, slippage)
     
     def limit_buy(self, symbol: str, size: float, price: float) -> Dict[str, Any]:
         """
@@ -111,17 +425,18 @@ class OrderHandler:
             return {"status": "error", "message": "Not connected to exchange"}
             
         try:
-            self.logger.info(f"Placing limit buy: {size} {symbol} @ {price}")
-            result = self.exchange.order(symbol, True, size, price, {"limit": {"tif": "Gtc"}})
+            self.logger.info("Placing limit buy: %s %s @ %s", size, symbol, price)
+            with self._signed_action():
+                result = self.exchange.order(symbol, True, size, price, {"limit": {"tif": "Gtc"}})
             
             if result["status"] == "ok":
                 status = result["response"]["data"]["statuses"][0]
                 if "resting" in status:
                     oid = status["resting"]["oid"]
-                    self.logger.info(f"Limit buy placed: order ID {oid}")
+                    self.logger.info("Limit buy placed: order ID %s", oid)
             return result
         except Exception as e:
-            self.logger.error(f"Error in limit buy: {str(e)}")
+            self.logger.error("Error in limit buy: %s", e)
             return {"status": "error", "message": str(e)}
     
     def limit_sell(self, symbol: str, size: float, price: float) -> Dict[str, Any]:
@@ -140,67 +455,46 @@ class OrderHandler:
             return {"status": "error", "message": "Not connected to exchange"}
             
         try:
-            self.logger.info(f"Placing limit sell: {size} {symbol} @ {price}")
-            result = self.exchange.order(symbol, False, size, price, {"limit": {"tif": "Gtc"}})
+            self.logger.info("Placing limit sell: %s %s @ %s", size, symbol, price)
+            with self._signed_action():
+                result = self.exchange.order(symbol, False, size, price, {"limit": {"tif": "Gtc"}})
             
             if result["status"] == "ok":
                 status = result["response"]["data"]["statuses"][0]
                 if "resting" in status:
                     oid = status["resting"]["oid"]
-                    self.logger.info(f"Limit sell placed: order ID {oid}")
+                    self.logger.info("Limit sell placed: order ID %s", oid)
             return result
         except Exception as e:
-            self.logger.error(f"Error in limit sell: {str(e)}")
+            self.logger.error("Error in limit sell: %s", e)
             return {"status": "error", "message": str(e)}
         
     # =================================Scaled Orders==============================================
-    def _calculate_order_distribution(self, total_size: float, num_orders: int, skew: float) -> List[float]:
+    def _meta_snapshot(self) -> Dict[str, int]:
         """
-        Calculate the size distribution across orders based on skew
+        Get size decimals by symbol, refetching exchange metadata once it is stale
         
-        Args:
-            total_size: Total order size
-            num_orders: Number of orders to place
-            skew: Skew factor (0 = linear, >0 = exponential)
-            
         Returns:
-            List of order sizes
+            Dict mapping symbol name to its szDecimals
         """
-        if num_orders <= 0:
-            return [total_size]
-            
-        if skew == 0:
-            # Linear distribution - equal sizes
-            return [total_size / num_orders] * num_orders
-            
-        # Exponential distribution based on skew
-        # Higher skew = more weight on earlier orders
-        weights = [pow(i+1, skew) for i in range(num_orders)]
-        total_weight = sum(weights)
-        
-        return [total_size * (weight / total_weight) for weight in weights]
+        now = time.monotonic()
+        if not self._sz_decimals or now - self._meta_fetched_at > self.META_TTL:
+            meta = self.info.meta()
+            self._sz_decimals = {asset_info["name"]: asset_info.get("szDecimals", 2)
+                                 for asset_info in meta["universe"]}
+            self._meta_fetched_at = now
+        return self._sz_decimals
         
-    def _calculate_price_levels(self, is_buy: bool, num_orders: int, start_price: float, end_price: float) -> List[float]:
+    def refresh_meta(self) -> Dict[str, int]:
         """
-        Calculate price levels for orders
+        Drop cached exchange metadata and fetch it again, e.g. after a new listing
         
-        Args:
-            is_buy: True for buy orders, False for sell orders
-            num_orders: Number of orders to place
-            start_price: Starting price (highest for buys, lowest for sells)
-            end_price: Ending price (lowest for buys, highest for sells)
-            
         Returns:
-            List of prices for each order
+            Dict mapping symbol name to its szDecimals
         """
-        if num_orders <= 1:
-            return [start_price]
-            
-        # Price step between orders
-        step = (end_price - start_price) / (num_orders - 1)
-        
-        # Generate price levels
-        return [start_price + (step * i) for i in range(num_orders)]
+        self._sz_decimals = {}
+        self._is_spot = {}
+        return self._meta_snapshot()
         
     def _format_size(self, symbol: str, size: float) -> float:
         """
@@ -213,28 +507,52 @@ class OrderHandler:
         Returns:
             Properly formatted size
         """
-        try:
-            # Get the metadata for the symbol
-            meta = self.info.meta()
+        # Format size based on symbol's decimal places, defaulting to 2
+        return round(size, self._meta_snapshot().get(symbol, 2))
+        
+    def _price_decimals(self, symbol: str) -> int:
+        """
+        Get the maximum price decimals for a symbol (8 for spot, 6 for perps)
+        
+        Args:
+            symbol: Trading pair symbol
             
-            # Find the symbol's info
-            symbol_info = None
-            for asset_info in meta["universe"]:
-                if asset_info["name"] == symbol:
-                    symbol_info = asset_info
-                    break
-                
-            if symbol_info:
-                # Format size based on symbol's decimal places
-                sz_decimals = symbol_info.get("szDecimals", 2)
-                return round(size, sz_decimals)
+        Returns:
+            Number of decimal places allowed in prices
+        """
+        is_spot = self._is_spot.get(symbol)
+        if is_spot is None:
+            info = self.info
+            asset_idx = info.coin_to_asset.get(info.name_to_coin.get(symbol, symbol))
+            if asset_idx is None:
+                # Default to 6 decimal places if we can't determine
+                return 6
+            is_spot = self._is_spot[symbol] = asset_idx >= 10_000
+            
+        return 8 if is_spot else 6
+        
+    @staticmethod
+    def _round_price(price: float, max_decimals: int) -> float:
+        """
+        Round a price to 5 significant figures and at most max_decimals places
+        
+        Args:
+            price: Price
+            max_decimals: Decimal places allowed for the symbol
             
-            # Default to 2 decimal places if symbol info not found
-            return round(size, 2)
+        Returns:
+            Rounded price
+        """
+        # Special handling for very large prices to avoid precision errors
+        if price > 100_000:
+            return round(price)
             
-        except Exception as e:
-            self.logger.warning(f"Error formatting size: {str(e)}. Using original size.")
-            return size
+        if price <= 0:
+            return round(price, max_decimals)
+            
+        # Round to 5 significant figures, capped at the coin's decimals
+        sig_decimals = 4 - math.floor(math.log10(price))
+        return round(price, min(sig_decimals, max_decimals))
         
     def _format_price(self, symbol: str, price: float) -> float:
         """
@@ -247,34 +565,84 @@ class OrderHandler:
         Returns:
             Properly formatted price
         """
+        return self._round_price(price, self._price_decimals(symbol))
+        
+    def _subscribe_book(self, symbol: str) -> None:
+        """
+        Subscribe to websocket l2Book updates for a symbol, once per connection
+        
+        Args:
+            symbol: Trading pair symbol
+        """
+        if symbol in self._book_subscriptions:
+            return
+        self._book_subscriptions.add(symbol)
+        
+        def on_book(msg, symbol=symbol):
+            self._book_cache[symbol] = (msg["data"], time.monotonic())
+            
         try:
-            # Special handling for very large prices to avoid precision errors
-            if price > 100_000:
-                return round(price)
-                
-            # First round to 5 significant figures
-            price_str = f"{price:.5g}"
-            price_float = float(price_str)
-            
-            # Then apply additional rounding based on coin type
-            coin = self.info.name_to_coin.get(symbol, symbol)
-            if coin:
-                asset_idx = self.info.coin_to_asset.get(coin)
-                if asset_idx is not None:
-                    is_spot = asset_idx >= 10_000
-                    max_decimals = 8 if is_spot else 6
-                    return round(price_float, max_decimals)
-                
-            # Default to 6 decimal places if we can't determine
-            return round(price_float, 6)
+            self.info.subscribe({"type": "l2Book", "coin": symbol}, on_book)
+        except Exception as e:
+            # Info created with skip_ws, or the socket is down; REST keeps working
+            self.logger.warning("Could not subscribe to %s order book: %s", symbol, e)
             
+    def _get_order_book(self, symbol: str) -> Dict[str, Any]:
+        """
+        Get the order book for a symbol, preferring a fresh websocket push over REST
+        
+        Args:
+            symbol: Trading pair symbol
+            
+        Returns:
+            l2 book dict with "levels" as returned by l2_snapshot
+        """
+        cached = self._book_cache.get(symbol)
+        if cached and time.monotonic() - cached[1] <= self.BOOK_MAX_AGE:
+            return cached[0]
+            
+        self._subscribe_book(symbol)
+        return self.info.l2_snapshot(symbol)
+        
+    def _bulk_order(self, order_requests: List[Dict[str, Any]],
+                    isolate_failures: bool = False) -> List[Dict[str, Any]]:
+        """
+        Submit several orders as one signed bulk order action
+        
+        Args:
+            order_requests: Orders with coin, is_buy, sz, limit_px, order_type and reduce_only keys
+            isolate_failures: If building or sending the action raises, resubmit each order on its own
+            
+        Returns:
+            One result per order, shaped like a single exchange.order response
+        """
+        # A batch weighs one request plus one per 40 orders
+        try:
+            with self._signed_action(1 + len(order_requests) // 40):
+                result = self.exchange.bulk_orders(order_requests)
         except Exception as e:
-            self.logger.warning(f"Error formatting price: {str(e)}. Using original price.")
-            return price
+            self.logger.error("Error placing bulk order: %s", e)
+            if isolate_failures and len(order_requests) > 1:
+                return [self._bulk_order([order_request])[0] for order_request in order_requests]
+            return [{"status": "error", "message": str(e)} for _ in order_requests]
+            
+        if result.get("status") != "ok":
+            message = str(result.get("response", result))
+            return [{"status": "error", "message": message} for _ in order_requests]
+            
+        results = []
+        for status in result["response"]["data"]["statuses"]:
+            if "error" in status:
+                results.append({"status": "error", "message": status["error"]})
+            else:
+                results.append({"status": "ok", "response": {"type": "order", "data": {"statuses": [status]}}})
+        return results
+        
 # ===================================== Scaled orders===========================================
     def scaled_orders(self, symbol: str, is_buy: bool, total_size: float, num_orders: int,
                     start_price: float, end_price: float, skew: float = 0,
-                    order_type: Dict = None, reduce_only: bool = False, check_market: bool = True) -> Dict[str, Any]:
+                    order_type: Dict = None, reduce_only: bool = False, check_market: bool = True,
+                    market_snapshot: Optional[Dict[str, Any]] = None, return_raw: bool = False) -> Dict[str, Any]:
         """
         Place multiple orders across a price range with an optional skew
         
@@ -289,26 +657,26 @@ class OrderHandler:
             order_type: Order type dict, defaults to GTC limit orders
             reduce_only: Whether orders should be reduce-only
             check_market: Whether to check market prices and adjust if needed
+            market_snapshot: Already fetched l2 snapshot for symbol, skips the fetch when given
+            return_raw: Whether to include the raw per-order responses under "results"
             
         Returns:
-            Dict containing status and order responses
+            Dict containing status plus oids, statuses and errors aligned with sizes and prices
         """
         if not self._check_connection():
             return {"status": "error", "message": "Not connected to exchange"}
         
         try:
-            # Validate inputs
-            if total_size <= 0:
-                return {"status": "error", "message": "Total size must be greater than 0"}
-                
-            if num_orders <= 0:
-                return {"status": "error", "message": "Number of orders must be greater than 0"}
-                
-            if start_price <= 0 or end_price <= 0:
-                return {"status": "error", "message": "Prices must be greater than 0"}
-                
-            if skew < 0:
-                return {"status": "error", "message": "Skew must be non-negative"}
+            # Validate inputs, reporting the first failed check
+            checks = (
+                (total_size > 0, "Total size must be greater than 0"),
+                (num_orders > 0, "Number of orders must be greater than 0"),
+                (start_price > 0 and end_price > 0, "Prices must be greater than 0"),
+                (skew >= 0, "Skew must be non-negative"),
+            )
+            invalid = next((message for ok, message in checks if not ok), None)
+            if invalid:
+                return {"status": "error", "message": invalid}
                 
             # Validate/adjust price direction based on order side
             if is_buy and start_price < end_price:
@@ -326,7 +694,7 @@ class OrderHandler:
             if check_market:
                 try:
                     # Get order book
-                    order_book = self.info.l2_snapshot(symbol)
+                    order_book = market_snapshot or self._get_order_book(symbol)
                     
                     if order_book and "levels" in order_book and len(order_book["levels"]) >= 2:
                         bid_levels = order_book["levels"][0]
@@ -336,117 +704,106 @@ class OrderHandler:
                             best_bid = float(bid_levels[0]["px"])
                             best_ask = float(ask_levels[0]["px"])
                             
-                            self.logger.info(f"Current market for {symbol}: Bid: {best_bid}, Ask: {best_ask}")
+                            if self.logger.isEnabledFor(logging.INFO):
+                                self.logger.info("Current market for %s: Bid: %s, Ask: %s", symbol, best_bid, best_ask)
                             
                             # For buy orders, ensure we're not buying above the ask
                             if is_buy:
                                 if start_price > best_ask * 1.05:  # Allow 5% above ask as maximum
-                                    self.logger.warning(f"Start price {start_price} is too high. Limiting to 5% above ask: {best_ask * 1.05}")
+                                    self.logger.warning("Start price %s is too high. Limiting to 5%% above ask: %s", start_price, best_ask * 1.05)
                                     start_price = min(start_price, best_ask * 1.05)
                                 
                                 # Make sure end price is not above best ask
                                 if end_price > best_ask:
-                                    self.logger.warning(f"End price {end_price} is above best ask. Setting to best bid.")
+                                    self.logger.warning("End price %s is above best ask. Setting to best bid.", end_price)
                                     end_price = best_bid
                                     
                             # For sell orders, ensure we're not selling below the bid
                             else:
                                 if start_price < best_bid * 0.95:  # Allow 5% below bid as minimum
-                                    self.logger.warning(f"Start price {start_price} is too low. Limiting to 5% below bid: {best_bid * 0.95}")
+                                    self.logger.warning("Start price %s is too low. Limiting to 5%% below bid: %s", start_price, best_bid * 0.95)
                                     start_price = max(start_price, best_bid * 0.95)
                                     
                                 # Make sure end price is not below best bid
                                 if end_price < best_bid:
-                                    self.logger.warning(f"End price {end_price} is below best bid. Setting to best ask.")
+                                    self.logger.warning("End price %s is below best bid. Setting to best ask.", end_price)
                                     end_price = best_ask
                 except Exception as e:
-                    self.logger.warning(f"Error checking market data: {str(e)}. Continuing with provided prices.")
+                    self.logger.warning("Error checking market data: %s. Continuing with provided prices.", e)
                     
             # Calculate size and price for each order
-            order_sizes = self._calculate_order_distribution(total_size, num_orders, skew)
-            price_levels = self._calculate_price_levels(is_buy, num_orders, start_price, end_price)
-            
-            # Format sizes and prices to correct precision
-            formatted_sizes = [self._format_size(symbol, s) for s in order_sizes]
-            formatted_prices = [self._format_price(symbol, p) for p in price_levels]
-            
-            # Place orders
-            self.logger.info(f"Placing {num_orders} {'buy' if is_buy else 'sell'} orders for {symbol} from {start_price} to {end_price} with total size {total_size}")
-            
-            order_results = []
+            order_sizes = order_distribution(total_size, num_orders, skew)
+            ladder_prices = price_levels(num_orders, start_price, end_price)
+            
+            # Format sizes and prices to correct precision, resolving the symbol's decimals once
+            sz_decimals = self._meta_snapshot().get(symbol, 2)
+            px_decimals = self._price_decimals(symbol)
+            round_price = self._round_price
+            formatted_sizes = [round(s, sz_decimals) for s in order_sizes]
+            formatted_prices = [round_price(p, px_decimals) for p in ladder_prices]
+            
+            # Place all orders in a single signed request
+            self.logger.info("Placing %s %s orders for %s from %s to %s with total size %s", num_orders, "buy" if is_buy else "sell", symbol, start_price, end_price, total_size)
+            
+            order_requests = [
+                {
+                    "coin": symbol,
+                    "is_buy": is_buy,
+                    "sz": size,
+                    "limit_px": price,
+                    "order_type": order_type,
+                    "reduce_only": reduce_only
+                }
+                for size, price in zip(formatted_sizes, formatted_prices)
+            ]
+            order_results = self._bulk_order(order_requests)
             successful_orders = 0
-            
-            for i in range(num_orders):
-                try:
-                    result = self.exchange.order(
-                        symbol, 
-                        is_buy, 
-                        formatted_sizes[i], 
-                        formatted_prices[i], 
-                        order_type, 
-                        reduce_only
-                    )
-                    
-                    order_results.append(result)
-                    
-                    if result["status"] == "ok":
-                        successful_orders += 1
-                        self.logger.info(f"Order {i+1}/{num_orders} placed: {formatted_sizes[i]} @ {formatted_prices[i]}")
+            oids, statuses, errors = [], [], []
+            
+            for i, result in enumerate(order_results):
+                if result["status"] == "ok":
+                    successful_orders += 1
+                    status = result["response"]["data"]["statuses"][0]
+                    if isinstance(status, str):
+                        # Bare states such as "waitingForFill" carry no oid
+                        state, oid = status, None
                     else:
-                        self.logger.error(f"Order {i+1}/{num_orders} failed: {result}")
-                        
-                    # Small delay to avoid rate limiting
-                    time.sleep(0.1)
-                    
-                except Exception as e:
-                    error_msg = f"Error placing order {i+1}/{num_orders}: {str(e)}"
-                    self.logger.error(error_msg)
-                    order_results.append({"status": "error", "message": error_msg})
-            
-            return {
+                        state = next(iter(status), "ok")
+                        detail = status.get(state)
+                        oid = detail.get("oid") if isinstance(detail, dict) else None
+                    oids.append(oid)
+                    statuses.append(state)
+                    errors.append(None)
+                    self.logger.info("Order %s/%s placed: %s @ %s", i+1, num_orders, formatted_sizes[i], formatted_prices[i])
+                else:
+                    oids.append(None)
+                    statuses.append("error")
+                    errors.append(result["message"])
+                    self.logger.error("Order %s/%s failed: %s", i+1, num_orders, result)
+            
+            response = {
                 "status": "ok" if successful_orders > 0 else "error",
                 "message": f"Successfully placed {successful_orders}/{num_orders} orders",
                 "successful_orders": successful_orders,
                 "total_orders": num_orders,
-                "results": order_results,
+                "oids": oids,
+                "statuses": statuses,
+                "errors": errors,
                 "sizes": formatted_sizes,
                 "prices": formatted_prices
             }
+            if return_raw:
+                response["results"] = order_results
+            return response
         except Exception as e:
-            self.logger.error(f"Error in scaled orders: {str(e)}")
+            self.logger.error("Error in scaled orders: %s", e)
             return {"status": "error", "message": str(e)}
 
-    # Also, fix the _calculate_price_levels function to ensure the range is correct
-    def _calculate_price_levels(self, is_buy: bool, num_orders: int, start_price: float, end_price: float) -> List[float]:
-        """
-        Calculate price levels for orders
-        
-        Args:
-            is_buy: True for buy orders, False for sell orders
-            num_orders: Number of orders to place
-            start_price: Starting price (higher for buys, lower for sells)
-            end_price: Ending price (lower for buys, higher for sells)
-            
-        Returns:
-            List of prices for each order
-        """
-        if num_orders <= 1:
-            return [start_price]
-            
-        # Calculate step size
-        step = (end_price - start_price) / (num_orders - 1)
-        
-        # Generate prices
-        prices = []
-        for i in range(num_orders):
-            price = start_price + step * i
-            prices.append(price)
-        
-        return prices
 # ================================ Perp Scaled Orders ==============================================
     def perp_scaled_orders(self, symbol: str, is_buy: bool, total_size: float, num_orders: int,
                          start_price: float, end_price: float, leverage: int = 1, skew: float = 0,
-                         order_type: Dict = None, reduce_only: bool = False) -> Dict[str, Any]:
+                         order_type: Dict = None, reduce_only: bool = False,
+                         return_raw: bool = False) -> Dict[str, Any]:
         """
         Place multiple perpetual orders across a price range with an optional skew
         
@@ -461,25 +818,40 @@ class OrderHandler:
             skew: Skew factor (0 = linear, >0 = exponential)
             order_type: Order type dict, defaults to GTC limit orders
             reduce_only: Whether orders should be reduce-only
+            return_raw: Whether to include the raw per-order responses under "results"
             
         Returns:
-            Dict containing status and order responses
+            Dict containing status plus oids, statuses and errors aligned with sizes and prices
         """
         if not self._check_connection():
             return {"status": "error", "message": "Not connected to exchange"}
             
         try:
-            # Set leverage first
-            self._set_leverage(symbol, leverage)
+            # Fetch the book while leverage is being set instead of one after the other
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                book_future = pool.submit(self._get_order_book, symbol)
+                self._set_leverage(symbol, leverage)
+                
+            try:
+                market_snapshot = book_future.result()
+            except Exception as e:
+                self.logger.warning("Error prefetching order book for %s: %s", symbol, e)
+                market_snapshot = None
             
             # Use the standard scaled orders implementation
-            return self.scaled_orders(
+            result = self.scaled_orders(
                 symbol, is_buy, total_size, num_orders, 
                 start_price, end_price, skew, 
-                order_type, reduce_only
+                order_type, reduce_only,
+                market_snapshot=market_snapshot,
+                return_raw=return_raw
             )
+            if result["status"] != "ok" or any(result.get("errors", ())):
+                self.invalidate_leverage(symbol)
+            return result
         except Exception as e:
-            self.logger.error(f"Error in perpetual scaled orders: {str(e)}")
+            self.invalidate_leverage(symbol)
+            self.logger.error("Error in perpetual scaled orders: %s", e)
             return {"status": "error", "message": str(e)}
                 
 # =================================Perp Trading==============================================
@@ -496,27 +868,7 @@ class OrderHandler:
         Returns:
             Order response dictionary
         """
-        if not self._check_connection():
-            return {"status": "error", "message": "Not connected to exchange"}
-            
-        try:
-            # Set leverage first
-            self._set_leverage(symbol, leverage)
-            
-            self.logger.info(f"Executing perp market buy: {size} {symbol} with {leverage}x leverage")
-            result = self.exchange.market_open(symbol, True, size, None, slippage)
-            
-            if result["status"] == "ok":
-                for status in result["response"]["data"]["statuses"]:
-                    if "filled" in status:
-                        filled = status["filled"]
-                        self.logger.info(f"Perp market buy executed: {filled['totalSz']} @ {filled['avgPx']}")
-                    elif "error" in status:
-                        self.logger.error(f"Perp market buy error: {status['error']}")
-            return result
-        except Exception as e:
-            self.logger.error(f"Error in perp market buy: {str(e)}")
-            return {"status": "error", "message": str(e)}
+        return self._market_open(symbol, True, size, slippage, leverage)
         
     def perp_market_sell(self, symbol: str, size: float, leverage: int = 1, slippage: float = 0.05) -> Dict[str, Any]:
         """
@@ -531,27 +883,7 @@ class OrderHandler:
         Returns:
             Order response dictionary
         """
-        if not self._check_connection():
-            return {"status": "error", "message": "Not connected to exchange"}
-            
-        try:
-            # Set leverage first
-            self._set_leverage(symbol, leverage)
-            
-            self.logger.info(f"Executing perp market sell: {size} {symbol} with {leverage}x leverage")
-            result = self.exchange.market_open(symbol, False, size, None, slippage)
-            
-            if result["status"] == "ok":
-                for status in result["response"]["data"]["statuses"]:
-                    if "filled" in status:
-                        filled = status["filled"]
-                        self.logger.info(f"Perp market sell executed: {filled['totalSz']} @ {filled['avgPx']}")
-                    elif "error" in status:
-                        self.logger.error(f"Perp market sell error: {status['error']}")
-            return result
-        except Exception as e:
-            self.logger.error(f"Error in perp market sell: {str(e)}")
-            return {"status": "error", "message": str(e)}
+        return self._market_open(symbol, False, size, slippage, leverage)
         
     def perp_limit_buy(self, symbol: str, size: float, price: float, leverage: int = 1) -> Dict[str, Any]:
         """
@@ -573,17 +905,19 @@ class OrderHandler:
             # Set leverage first
             self._set_leverage(symbol, leverage)
             
-            self.logger.info(f"Placing perp limit buy: {size} {symbol} @ {price} with {leverage}x leverage")
-            result = self.exchange.order(symbol, True, size, price, {"limit": {"tif": "Gtc"}})
+            self.logger.info("Placing perp limit buy: %s %s @ %s with %sx leverage", size, symbol, price, leverage)
+            with self._signed_action():
+                result = self.exchange.order(symbol, True, size, price, {"limit": {"tif": "Gtc"}})
             
             if result["status"] == "ok":
                 status = result["response"]["data"]["statuses"][0]
                 if "resting" in status:
                     oid = status["resting"]["oid"]
-                    self.logger.info(f"Perp limit buy placed: order ID {oid}")
-            return result
+                    self.logger.info("Perp limit buy placed: order ID %s", oid)
+            return self._check_perp_result(symbol, result)
         except Exception as e:
-            self.logger.error(f"Error in perp limit buy: {str(e)}")
+            self.invalidate_leverage(symbol)
+            self.logger.error("Error in perp limit buy: %s", e)
             return {"status": "error", "message": str(e)}
         
     def perp_limit_sell(self, symbol: str, size: float, price: float, leverage: int = 1) -> Dict[str, Any]:
@@ -606,17 +940,19 @@ class OrderHandler:
             # Set leverage first
             self._set_leverage(symbol, leverage)
             
-            self.logger.info(f"Placing perp limit sell: {size} {symbol} @ {price} with {leverage}x leverage")
-            result = self.exchange.order(symbol, False, size, price, {"limit": {"tif": "Gtc"}})
+            self.logger.info("Placing perp limit sell: %s %s @ %s with %sx leverage", size, symbol, price, leverage)
+            with self._signed_action():
+                result = self.exchange.order(symbol, False, size, price, {"limit": {"tif": "Gtc"}})
             
             if result["status"] == "ok":
                 status = result["response"]["data"]["statuses"][0]
                 if "resting" in status:
                     oid = status["resting"]["oid"]
-                    self.logger.info(f"Perp limit sell placed: order ID {oid}")
-            return result
+                    self.logger.info("Perp limit sell placed: order ID %s", oid)
+            return self._check_perp_result(symbol, result)
         except Exception as e:
-            self.logger.error(f"Error in perp limit sell: {str(e)}")
+            self.invalidate_leverage(symbol)
+            self.logger.error("Error in perp limit sell: %s", e)
             return {"status": "error", "message": str(e)}
 
     def close_position(self, symbol: str, slippage: float = 0.05) -> Dict[str, Any]:
@@ -632,13 +968,14 @@ class OrderHandler:
         """
         return self.market_close_position(symbol, slippage)
 
-    def _set_leverage(self, symbol: str, leverage: int) -> Dict[str, Any]:
+    def _set_leverage(self, symbol: str, leverage: int, force: bool = False) -> Dict[str, Any]:
         """
         Set leverage for a symbol
         
         Args:
             symbol: Trading pair symbol
             leverage: Leverage multiplier
+            force: Send the update even if this handler already set the same leverage
             
         Returns:
             Response dictionary
@@ -646,13 +983,54 @@ class OrderHandler:
         if not self._check_connection():
             return {"status": "error", "message": "Not connected to exchange"}
             
+        # Skip the request when this handler already set the same leverage
+        if not force and self._leverage_cache.get(symbol) == leverage:
+            return {"status": "ok", "message": "cached"}
+            
         try:
-            self.logger.info(f"Setting {leverage}x leverage for {symbol}")
-            result = self.exchange.update_leverage(leverage, symbol)
+            self.logger.info("Setting %sx leverage for %s", leverage, symbol)
+            with self._signed_action():
+                result = self.exchange.update_leverage(leverage, symbol)
+            if result.get("status") == "ok":
+                self._leverage_cache[symbol] = leverage
+            else:
+                self.invalidate_leverage(symbol)
             return result
         except Exception as e:
-            self.logger.error(f"Error setting leverage: {str(e)}")
+            self.invalidate_leverage(symbol)
+            self.logger.error("Error setting leverage: %s", e)
             return {"status": "error", "message": str(e)}
+            
+    def _check_perp_result(self, symbol: str, result: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Forget cached leverage for a symbol when a perp order came back with an error
+        
+        Args:
+            symbol: Trading pair symbol
+            result: Order response dictionary
+            
+        Returns:
+            The same response dictionary
+        """
+        failed = result.get("status") != "ok"
+        if not failed:
+            statuses = result.get("response", {}).get("data", {}).get("statuses", [])
+            failed = any(isinstance(status, dict) and "error" in status for status in statuses)
+        if failed:
+            self.invalidate_leverage(symbol)
+        return result
+        
+    def invalidate_leverage(self, symbol: Optional[str] = None) -> None:
+        """
+        Forget cached leverage so the next perp order sets it again
+        
+        Args:
+            symbol: Symbol to forget, or None to forget all symbols
+        """
+        if symbol is None:
+            self._leverage_cache.clear()
+        else:
+            self._leverage_cache.pop(symbol, None)
 # =================================Order Cancellation==============================================
     def cancel_order(self, symbol: str, order_id: int) -> Dict[str, Any]:
         """
@@ -669,24 +1047,75 @@ class OrderHandler:
             return {"status": "error", "message": "Not connected to exchange"}
             
         try:
-            self.logger.info(f"Cancelling order {order_id} for {symbol}")
-            result = self.exchange.cancel(symbol, order_id)
+            self.logger.info("Cancelling order %s for %s", order_id, symbol)
+            with self._signed_action():
+                result = self.exchange.cancel(symbol, order_id)
             
             if result["status"] == "ok":
-                self.logger.info(f"Order {order_id} cancelled successfully")
+                self.logger.info("Order %s cancelled successfully", order_id)
             else:
-                self.logger.error(f"Failed to cancel order {order_id}: {result}")
+                self.logger.error("Failed to cancel order %s: %s", order_id, result)
             return result
         except Exception as e:
-            self.logger.error(f"Error cancelling order: {str(e)}")
+            self.logger.error("Error cancelling order: %s", e)
             return {"status": "error", "message": str(e)}
     
-    def cancel_all_orders(self, symbol: Optional[str] = None) -> Dict[str, Any]:
+    def bulk_cancel_orders(self, cancels: List[Tuple[str, int]]) -> Dict[str, Any]:
+        """
+        Cancel several orders in one signed bulk cancel action
+        
+        Args:
+            cancels: (symbol, order_id) pairs to cancel
+            
+        Returns:
+            Dictionary with cancellation results
+        """
+        if not self._check_connection():
+            return {"status": "error", "message": "Not connected to exchange"}
+            
+        results = {"cancelled": 0, "failed": 0, "details": []}
+        if not cancels:
+            return {"status": "ok", "data": results}
+            
+        try:
+            if hasattr(self.exchange, "bulk_cancel"):
+                with self._signed_action(1 + len(cancels) // 40):
+                    result = self.exchange.bulk_cancel([{"coin": coin, "oid": oid} for coin, oid in cancels])
+                
+                if result.get("status") == "ok":
+                    details = []
+                    for status in result["response"]["data"]["statuses"]:
+                        if isinstance(status, dict) and "error" in status:
+                            details.append({"status": "error", "message": status["error"]})
+                        else:
+                            details.append({"status": "ok", "response": {"type": "cancel", "data": {"statuses": [status]}}})
+                else:
+                    message = str(result.get("response", result))
+                    details = [{"status": "error", "message": message} for _ in cancels]
+            else:
+                # Older SDKs without bulk_cancel fall back to one cancel per order
+                details = [self.cancel_order(coin, oid) for coin, oid in cancels]
+                
+            for detail in details:
+                if detail["status"] == "ok":
+                    results["cancelled"] += 1
+                else:
+                    results["failed"] += 1
+            results["details"] = details
+                    
+            self.logger.info("Cancelled %s orders, %s failed", results['cancelled'], results['failed'])
+            return {"status": "ok", "data": results}
+        except Exception as e:
+            self.logger.error("Error bulk cancelling orders: %s", e)
+            return {"status": "error", "message": str(e)}
+    
+    def cancel_all_orders(self, symbol: Optional[str] = None, priority: str = "as_returned") -> Dict[str, Any]:
         """
         Cancel all open orders, optionally filtered by symbol
         
         Args:
             symbol: Optional trading pair symbol to filter cancellations
+            priority: "as_returned" keeps exchange order, "largest_first" cancels the biggest orders first
             
         Returns:
             Dictionary with cancellation results
@@ -695,23 +1124,22 @@ class OrderHandler:
             return {"status": "error", "message": "Not connected to exchange"}
             
         try:
-            self.logger.info(f"Cancelling all orders{' for ' + symbol if symbol else ''}")
-            open_orders = self.info.open_orders(self.wallet_address)
-            
-            results = {"cancelled": 0, "failed": 0, "details": []}
-            for order in open_orders:
-                if symbol is None or order["coin"] == symbol:
-                    result = self.cancel_order(order["coin"], order["oid"])
-                    if result["status"] == "ok":
-                        results["cancelled"] += 1
-                    else:
-                        results["failed"] += 1
-                    results["details"].append(result)
-                    
-            self.logger.info(f"Cancelled {results['cancelled']} orders, {results['failed']} failed")
-            return {"status": "ok", "data": results}
+            orders = self._iter_open_orders(symbol)
+            if priority == "largest_first":
+                # Pull the most exposure first if the cancels end up split or throttled
+                orders = sorted(orders, key=lambda order: float(order.get("sz", 0)), reverse=True)
+            elif priority != "as_returned":
+                return {"status": "error", "message": f"Unknown cancel priority: {priority}"}
+                
+            cancels = [(order["coin"], order["oid"]) for order in orders]
+            if not cancels:
+                # Nothing to cancel; skip the dispatch and its logging
+                return {"status": "ok", "data": {"cancelled": 0, "failed": 0, "details": []}}
+                
+            self.logger.info("Cancelling %s orders%s", len(cancels), " for " + symbol if symbol else "")
+            return self.bulk_cancel_orders(cancels)
         except Exception as e:
-            self.logger.error(f"Error cancelling all orders: {str(e)}")
+            self.logger.error("Error cancelling all orders: %s", e)
             return {"status": "error", "message": str(e)}
     
     def get_open_orders(self, symbol: Optional[str] = None) -> List[Dict[str, Any]]:
@@ -725,20 +1153,25 @@ class OrderHandler:
             List of open orders
         """
         if not self.info or not self.wallet_address:
-            self.logger.error(f"Not connected to exchange. info={self.info}, wallet_address={self.wallet_address}")
+            self.logger.error("Not connected to exchange. info=%s, wallet_address=%s", self.info, self.wallet_address)
             return []
             
         try:
-            open_orders = self.info.open_orders(self.wallet_address)
-            self.logger.info(f"[DEBUG] Fetched {len(open_orders)} open orders from API for wallet {self.wallet_address}: {open_orders}")
+            open_orders = self._cached_open_orders()
+            debug = self.logger.isEnabledFor(logging.DEBUG)
+            if debug:
+                self.logger.debug("Fetched %d open orders for wallet %s: %s", len(open_orders), self.wallet_address, open_orders)
             if symbol:
-                filtered = [order for order in open_orders if order['coin'] == symbol]
-                self.logger.info(f"[DEBUG] Filtering open orders for symbol '{symbol}'. Available coins: {[order['coin'] for order in open_orders]}")
-                self.logger.info(f"[DEBUG] Filtered open orders for symbol {symbol}: {filtered}")
+                # Filter the snapshot already fetched so the result matches what was logged
+                filtered = [order for order in open_orders if order["coin"] == symbol]
+                if debug:
+                    self.logger.debug("Filtering open orders for symbol '%s'. Available coins: %s",
+                                      symbol, [order['coin'] for order in open_orders])
+                    self.logger.debug("Filtered open orders for symbol %s: %s", symbol, filtered)
                 return filtered
             return open_orders
         except Exception as e:
-            self.logger.error(f"Error getting open orders: {str(e)}")
+            self.logger.error("Error getting open orders: %s", e)
             return []
     
     def market_close_position(self, symbol: str, slippage: float = 0.05) -> Dict[str, Any]:
@@ -756,19 +1189,20 @@ class OrderHandler:
             return {"status": "error", "message": "Not connected to exchange"}
             
         try:
-            self.logger.info(f"Closing position for {symbol}")
-            result = self.exchange.market_close(symbol, None, None, slippage)
+            self.logger.info("Closing position for %s", symbol)
+            with self._signed_action():
+                result = self.exchange.market_close(symbol, None, None, slippage)
             
             if result["status"] == "ok":
                 for status in result["response"]["data"]["statuses"]:
                     if "filled" in status:
                         filled = status["filled"]
-                        self.logger.info(f"Position closed: {filled['totalSz']} @ {filled['avgPx']}")
+                        self.logger.info("Position closed: %s @ %s", filled['totalSz'], filled['avgPx'])
                     elif "error" in status:
-                        self.logger.error(f"Position close error: {status['error']}")
+                        self.logger.error("Position close error: %s", status['error'])
             return result
         except Exception as e:
-            self.logger.error(f"Error closing position: {str(e)}")
+            self.logger.error("Error closing position: %s", e)
             return {"status": "error", "message": str(e)}
         
 # ================================= Place Order ==========================================
@@ -791,31 +1225,31 @@ class OrderHandler:
             return {"status": "error", "message": "Not connected to exchange"}
             
         try:
-            self.logger.info(f"Placing {order_type} {side}: {size} {symbol} @ {price}")
+            self.logger.info("Placing %s %s: %s %s @ %s", order_type, side, size, symbol, price)
             
-            is_buy = side.lower() == "buy"
+            is_buy = _SIDE_MAP.get(side.lower())
+            if is_buy is None:
+                return {"status": "error", "message": f"Unsupported order side: {side}"}
             
             # For limit orders
             if order_type.lower() == "limit":
-                hyperliquid_order_type = {"limit": {"tif": "Gtc"}}
-                if time_in_force.upper() == "IOC":
-                    hyperliquid_order_type = {"limit": {"tif": "Ioc"}}
-                elif time_in_force.upper() == "FOK":
-                    hyperliquid_order_type = {"limit": {"tif": "Fok"}}
+                hyperliquid_order_type = _TIF_MAP.get(time_in_force.upper(), _TIF_MAP["GTC"])
                 
-                result = self.exchange.order(symbol, is_buy, size, price, hyperliquid_order_type)
+                with self._signed_action():
+                    result = self.exchange.order(symbol, is_buy, size, price, hyperliquid_order_type)
                 return result  # Return the raw result for proper processing
                 
             # For market orders
             elif order_type.lower() == "market":
-                result = self.exchange.market_open(symbol, is_buy, size, None, 0.05)  # Use 5% slippage by default
+                with self._signed_action():
+                    result = self.exchange.market_open(symbol, is_buy, size, None, 0.05)  # Use 5% slippage by default
                 return result  # Return the raw result for proper processing
             
             # For other cases, return an error
             return {"status": "error", "message": f"Unsupported order type: {order_type}"}
             
         except Exception as e:
-            self.logger.error(f"Error placing order: {str(e)}")
+            self.logger.error("Error placing order: %s", e)
             return {"status": "error", "message": str(e)}
 # ================================= Timestamped Orders ==========================================
     def get_timestamp(self):
@@ -833,6 +1267,15 @@ class OrderHandler:
 class TwapExecution:
     """Handles TWAP (Time-Weighted Average Price) order execution"""
     
+    __slots__ = (
+        "order_handler", "symbol", "side", "total_quantity", "duration_minutes", "num_slices",
+        "price_limit", "is_perp", "leverage", "quantity_per_slice", "interval_seconds",
+        "place_slice", "slice_args",
+        "is_running", "start_time", "end_time", "started_at", "slices_executed", "total_executed",
+        "average_price", "executed_notional", "execution_prices", "errors",
+        "stop_event", "done_event", "status_snapshot", "logger"
+    )
+    
     def __init__(self, order_handler, symbol: str, side: str, total_quantity: float, 
                 duration_minutes: int, num_slices: int, price_limit: Optional[float] = None,
                 is_perp: bool = False, leverage: int = 1):
@@ -864,6 +1307,19 @@ class TwapExecution:
         self.quantity_per_slice = total_quantity / num_slices
         self.interval_seconds = (duration_minutes * 60) / num_slices
         
+        # Resolve how each slice is placed once, based on side and type (spot or perp)
+        is_buy = self.side == 'buy'
+        if price_limit:
+            # Limit orders are batched with slices from other TWAPs
+            self.place_slice = self._submit_limit_slice
+            self.slice_args = ()
+        elif is_perp:
+            self.place_slice = order_handler.perp_market_buy if is_buy else order_handler.perp_market_sell
+            self.slice_args = (symbol, self.quantity_per_slice, leverage)
+        else:
+            self.place_slice = order_handler.market_buy if is_buy else order_handler.market_sell
+            self.slice_args = (symbol, self.quantity_per_slice)
+        
         # Initialize tracking variables
         self.is_running = False
         self.start_time = None
@@ -871,12 +1327,15 @@ class TwapExecution:
         self.slices_executed = 0
         self.total_executed = 0.0
         self.average_price = 0.0
+        self.executed_notional = 0.0
         self.execution_prices = []
         self.errors = []
-        self.thread = None
         self.stop_event = threading.Event()
+        self.done_event = threading.Event()
+        self.started_at = None
         
         self.logger = logging.getLogger(__name__)
+        self._publish_status()
     
     def start(self) -> bool:
         """Start the TWAP execution"""
@@ -888,34 +1347,50 @@ class TwapExecution:
         self.end_time = self.start_time + timedelta(minutes=self.duration_minutes)
         self.is_running = True
         self.stop_event.clear()
+        self.done_event.clear()
+        self._publish_status()
         
-        self.logger.info(f"Starting TWAP execution for {self.total_quantity} {self.symbol} "
-                        f"over {self.duration_minutes} minutes in {self.num_slices} slices")
+        self.logger.info("Starting TWAP execution for %s %s over %s minutes in %s slices",
+                         self.total_quantity, self.symbol, self.duration_minutes, self.num_slices)
         
-        # Start execution thread
-        self.thread = threading.Thread(target=self._execute_strategy)
-        self.thread.daemon = True
-        self.thread.start()
+        # Slices run on the order handler's shared scheduler, starting now
+        self.started_at = time.monotonic()
+        self.order_handler._twap_scheduler.schedule(self.started_at, self, 1)
         
         return True
     
-    def stop(self) -> bool:
-        """Stop the TWAP execution"""
+    def stop(self, wait: bool = True) -> bool:
+        """
+        Stop the TWAP execution
+        
+        Args:
+            wait: Whether to wait for an in-flight slice to finish
+            
+        Returns:
+            bool: True if the execution was running and has been signalled to stop
+        """
         if not self.is_running:
             self.logger.warning("TWAP execution not running")
             return False
         
         self.logger.info("Stopping TWAP execution")
         self.stop_event.set()
-        if self.thread:
-            self.thread.join(timeout=5)
-        
-        self.is_running = False
+        if self.order_handler._twap_scheduler.cancel(self):
+            # Nothing in flight, the next slice was still waiting to fire
+            self._finish()
+        if wait:
+            self.join()
         return True
     
-    def get_status(self) -> Dict[str, Any]:
-        """Get the current status of the TWAP execution"""
-        return {
+    def join(self, timeout: float = 5) -> None:
+        """Wait for any in-flight slice to finish and mark the TWAP as stopped"""
+        self.done_event.wait(timeout=timeout)
+        self.is_running = False
+        self._publish_status()
+    
+    def _publish_status(self) -> None:
+        """Rebuild the status snapshot; readers pick it up with a single reference read"""
+        self.status_snapshot = {
             "symbol": self.symbol,
             "side": self.side,
             "is_perp": self.is_perp,
@@ -935,84 +1410,83 @@ class TwapExecution:
             "errors": self.errors
         }
     
-    def _execute_strategy(self) -> None:
-        """Execute the TWAP strategy - runs in a separate thread"""
+    def get_status(self) -> Dict[str, Any]:
+        """Get the current status of the TWAP execution"""
+        return dict(self.status_snapshot)
+    
+    def _run_slice(self, slice_num: int) -> None:
+        """Execute one slice and schedule the next - runs on the scheduler's worker pool"""
         try:
-            for slice_num in range(self.num_slices):
-                # Check if we should stop
-                if self.stop_event.is_set():
-                    self.logger.info("TWAP execution stopped by user")
-                    break
-                
-                # Execute slice
-                slice_start_time = time.time()
-                self._execute_slice(slice_num + 1)
-                self.slices_executed += 1
-                
-                # Wait until the next interval, unless it's the last slice
-                if slice_num < self.num_slices - 1:
-                    # Calculate time to wait
-                    elapsed = time.time() - slice_start_time
-                    wait_time = max(0, self.interval_seconds - elapsed)
-                    
-                    # Wait, but check for stop event every second
-                    for _ in range(int(wait_time)):
-                        if self.stop_event.is_set():
-                            self.logger.info("TWAP execution stopped during interval wait")
-                            break
-                        time.sleep(1)
-                    
-                    # Sleep any remaining fraction of a second
-                    time.sleep(wait_time - int(wait_time))
+            # Check if we should stop
+            if self.stop_event.is_set():
+                self.logger.info("TWAP execution stopped by user")
+                self._finish()
+                return
             
-            if self.slices_executed == self.num_slices:
-                self.logger.info("TWAP execution completed successfully")
-            else:
-                self.logger.info(f"TWAP execution stopped after {self.slices_executed}/{self.num_slices} slices")
+            self._execute_slice(slice_num)
+            self.slices_executed += 1
+            self._publish_status()
         
         except Exception as e:
-            self.logger.error(f"Error in TWAP execution: {str(e)}")
+            self.logger.error("Error in TWAP execution: %s", e)
             self.errors.append(str(e))
+            self._finish()
+            return
+        
+        if slice_num < self.num_slices and not self.stop_event.is_set():
+            # Next slice fires one interval after this one was due
+            fire_at = self.started_at + slice_num * self.interval_seconds
+            self.order_handler._twap_scheduler.schedule(fire_at, self, slice_num + 1)
+        else:
+            self._finish()
+    
+    def _finish(self) -> None:
+        """Mark the execution as finished and wake anyone waiting in join"""
+        if self.slices_executed == self.num_slices:
+            self.logger.info("TWAP execution completed successfully")
+        else:
+            self.logger.info("TWAP execution stopped after %s/%s slices", self.slices_executed, self.num_slices)
         
-        finally:
-            self.is_running = False
+        self.is_running = False
+        self._publish_status()
+        self.done_event.set()
+    
+    def _submit_limit_slice(self) -> Dict[str, Any]:
+        """Place this slice's limit order through the order handler's shared slice batcher"""
+        handler = self.order_handler
+        if not handler._check_connection():
+            return {"status": "error", "message": "Not connected to exchange"}
+            
+        # Reject what the SDK would choke on here, before it can share a bulk action with other TWAPs
+        info = handler.info
+        if info.name_to_coin.get(self.symbol) not in info.coin_to_asset:
+            return {"status": "error", "message": f"Unknown symbol: {self.symbol}"}
+        size = handler._format_size(self.symbol, self.quantity_per_slice)
+        price = handler._format_price(self.symbol, self.price_limit)
+            
+        if self.is_perp:
+            handler._set_leverage(self.symbol, self.leverage)
+            
+        future = handler._slice_batcher.submit({
+            "coin": self.symbol,
+            "is_buy": self.side == 'buy',
+            "sz": size,
+            "limit_px": price,
+            "order_type": {"limit": {"tif": "Gtc"}},
+            "reduce_only": False
+        })
+        result = future.result()
+        if self.is_perp:
+            handler._check_perp_result(self.symbol, result)
+        return result
     
     def _execute_slice(self, slice_num: int) -> None:
         """Execute a single slice of the TWAP order"""
         try:
-            self.logger.info(f"Executing TWAP slice {slice_num}/{self.num_slices} for {self.quantity_per_slice} {self.symbol}")
+            self.logger.info("Executing TWAP slice %s/%s for %s %s", slice_num, self.num_slices, self.quantity_per_slice, self.symbol)
             
-            # Execute the slice based on side and type (spot or perp)
-            result = None
-            
-            if self.is_perp:
-                # Perpetual order
-                if self.side == 'buy':
-                    if self.price_limit:
-                        result = self.order_handler.perp_limit_buy(self.symbol, self.quantity_per_slice, 
-                                                                self.price_limit, self.leverage)
-                    else:
-                        result = self.order_handler.perp_market_buy(self.symbol, self.quantity_per_slice, 
-                                                                self.leverage)
-                else:  # sell
-                    if self.price_limit:
-                        result = self.order_handler.perp_limit_sell(self.symbol, self.quantity_per_slice, 
-                                                                self.price_limit, self.leverage)
-                    else:
-                        result = self.order_handler.perp_market_sell(self.symbol, self.quantity_per_slice, 
-                                                                    self.leverage)
-            else:
-                # Spot order
-                if self.side == 'buy':
-                    if self.price_limit:
-                        result = self.order_handler.limit_buy(self.symbol, self.quantity_per_slice, self.price_limit)
-                    else:
-                        result = self.order_handler.market_buy(self.symbol, self.quantity_per_slice)
-                else:  # sell
-                    if self.price_limit:
-                        result = self.order_handler.limit_sell(self.symbol, self.quantity_per_slice, self.price_limit)
-                    else:
-                        result = self.order_handler.market_sell(self.symbol, self.quantity_per_slice)
+            # Place the slice with the order method resolved in __init__
+            result = self.place_slice(*self.slice_args)
             
             # Process the result
             if result and result["status"] == "ok":
@@ -1024,20 +1498,21 @@ class TwapExecution:
                             executed_price = float(filled["avgPx"])
                             
                             self.total_executed += executed_qty
+                            self.executed_notional += executed_qty * executed_price
                             self.execution_prices.append(executed_price)
                             
-                            # Update average price
-                            if self.execution_prices:
-                                self.average_price = sum(self.execution_prices) / len(self.execution_prices)
+                            # Update volume-weighted average price from the running totals
+                            if self.total_executed:
+                                self.average_price = self.executed_notional / self.total_executed
                             
-                            self.logger.info(f"TWAP slice {slice_num} executed: {executed_qty} @ {executed_price}")
+                            self.logger.info("TWAP slice %s executed: %s @ %s", slice_num, executed_qty, executed_price)
             else:
                 error_msg = result.get("message", "Unknown error") if result else "No result returned"
-                self.logger.error(f"TWAP slice {slice_num} failed: {error_msg}")
+                self.logger.error("TWAP slice %s failed: %s", slice_num, error_msg)
                 self.errors.append(f"Slice {slice_num}: {error_msg}")
         
         except Exception as e:
-            self.logger.error(f"Error executing TWAP slice {slice_num}: {str(e)}")
+            self.logger.error("Error executing TWAP slice %s: %s", slice_num, e)
             self.errors.append(f"Slice {slice_num}: {str(e)}")
 
 
@@ -1046,9 +1521,16 @@ class TwapExecution:
         """Initialize TWAP components if needed"""
         if not hasattr(self, 'active_twaps'):
             self.active_twaps = {}  # Dictionary to store active TWAP executions by ID
-            self.completed_twaps = {}  # Dictionary to store completed TWAP executions by ID
+            self.completed_twaps = OrderedDict()  # Completed TWAP executions by ID, oldest first
             self.twap_id_counter = 1
-            self.twap_lock = threading.Lock()  # Lock for thread safety
+            self.twap_lock = threading.RLock()  # Reentrant so manager methods can nest safely
+
+    def _complete_twap(self, twap_id: str, twap: "TwapExecution") -> None:
+        """Record a finished TWAP, evicting the oldest beyond MAX_COMPLETED_TWAPS (caller holds twap_lock)"""
+        self.completed_twaps[twap_id] = twap
+        self.completed_twaps.move_to_end(twap_id)
+        while len(self.completed_twaps) > MAX_COMPLETED_TWAPS:
+            self.completed_twaps.popitem(last=False)
 
     def create_twap(self, symbol: str, side: str, quantity: float, 
                 duration_minutes: int, num_slices: int, 
@@ -1089,7 +1571,7 @@ class TwapExecution:
             )
             
             self.active_twaps[twap_id] = twap
-            self.logger.info(f"Created TWAP {twap_id} for {quantity} {symbol}")
+            self.logger.info("Created TWAP %s for %s %s", twap_id, quantity, symbol)
             
             return twap_id
 
@@ -1107,16 +1589,16 @@ class TwapExecution:
         
         with self.twap_lock:
             if twap_id not in self.active_twaps:
-                self.logger.error(f"Cannot start TWAP {twap_id} - not found")
+                self.logger.error("Cannot start TWAP %s - not found", twap_id)
                 return False
             
             twap = self.active_twaps[twap_id]
             success = twap.start()
             
             if success:
-                self.logger.info(f"Started TWAP {twap_id}")
+                self.logger.info("Started TWAP %s", twap_id)
             else:
-                self.logger.warning(f"Failed to start TWAP {twap_id}")
+                self.logger.warning("Failed to start TWAP %s", twap_id)
             
             return success
 
@@ -1134,23 +1616,27 @@ class TwapExecution:
         
         with self.twap_lock:
             if twap_id not in self.active_twaps:
-                self.logger.error(f"Cannot stop TWAP {twap_id} - not found")
+                self.logger.error("Cannot stop TWAP %s - not found", twap_id)
                 return False
             
             twap = self.active_twaps[twap_id]
-            success = twap.stop()
-            
-            if success:
-                self.logger.info(f"Stopped TWAP {twap_id}")
-                
-                # Move to completed if it's no longer running
-                if not twap.is_running:
-                    self.completed_twaps[twap_id] = twap
-                    del self.active_twaps[twap_id]
-            else:
-                self.logger.warning(f"Failed to stop TWAP {twap_id}")
-            
-            return success
+            success = twap.stop(wait=False)
+        
+        if not success:
+            self.logger.warning("Failed to stop TWAP %s", twap_id)
+            return False
+        
+        # Wait for an in-flight slice without blocking status reads from other threads
+        twap.join()
+        self.logger.info("Stopped TWAP %s", twap_id)
+        
+        with self.twap_lock:
+            # Move to completed unless another caller already did
+            if self.active_twaps.get(twap_id) is twap:
+                self._complete_twap(twap_id, twap)
+                del self.active_twaps[twap_id]
+        
+        return True
 
     def get_twap_status(self, twap_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -1164,22 +1650,21 @@ class TwapExecution:
         """
         self.__init_twap_if_needed()
         
-        with self.twap_lock:
-            if twap_id in self.active_twaps:
-                twap = self.active_twaps[twap_id]
-                status = twap.get_status()
-                status["id"] = twap_id
-                status["status"] = "active"
-                return status
-            elif twap_id in self.completed_twaps:
-                twap = self.completed_twaps[twap_id]
-                status = twap.get_status()
-                status["id"] = twap_id
-                status["status"] = "completed"
-                return status
-            else:
-                self.logger.error(f"Cannot get status for TWAP {twap_id} - not found")
-                return None
+        # Single dict lookups need no lock; a TWAP is added to completed before
+        # it leaves active, so it is always visible in one of them
+        twap = self.active_twaps.get(twap_id)
+        state = "active"
+        if twap is None:
+            twap = self.completed_twaps.get(twap_id)
+            state = "completed"
+        if twap is None:
+            self.logger.error("Cannot get status for TWAP %s - not found", twap_id)
+            return None
+        
+        status = twap.get_status()
+        status["id"] = twap_id
+        status["status"] = state
+        return status
 
     def list_twaps(self) -> Dict[str, List[Dict[str, Any]]]:
         """
@@ -1190,25 +1675,29 @@ class TwapExecution:
         """
         self.__init_twap_if_needed()
         
+        # Hold the lock only long enough to copy the references
         with self.twap_lock:
-            active = []
-            for twap_id, twap in self.active_twaps.items():
-                status = twap.get_status()
-                status["id"] = twap_id
-                status["status"] = "active"
-                active.append(status)
-            
-            completed = []
-            for twap_id, twap in self.completed_twaps.items():
-                status = twap.get_status()
-                status["id"] = twap_id
-                status["status"] = "completed"
-                completed.append(status)
-            
-            return {
-                "active": active,
-                "completed": completed
-            }
+            active_twaps = list(self.active_twaps.items())
+            completed_twaps = list(self.completed_twaps.items())
+        
+        active = []
+        for twap_id, twap in active_twaps:
+            status = twap.get_status()
+            status["id"] = twap_id
+            status["status"] = "active"
+            active.append(status)
+        
+        completed = []
+        for twap_id, twap in completed_twaps:
+            status = twap.get_status()
+            status["id"] = twap_id
+            status["status"] = "completed"
+            completed.append(status)
+        
+        return {
+            "active": active,
+            "completed": completed
+        }
 
     def clean_completed_twaps(self) -> int:
         """
@@ -1222,7 +1711,7 @@ class TwapExecution:
         with self.twap_lock:
             count = len(self.completed_twaps)
             self.completed_twaps.clear()
-            self.logger.info(f"Cleaned up {count} completed TWAP executions")
+            self.logger.info("Cleaned up %s completed TWAP executions", count)
             return count
 
     def stop_all_twaps(self) -> int:
@@ -1234,19 +1723,28 @@ class TwapExecution:
         """
         self.__init_twap_if_needed()
         
+        # Signal every running TWAP first so they all wind down at once
         with self.twap_lock:
-            count = 0
-            twap_ids = list(self.active_twaps.keys())
-            
-            for twap_id in twap_ids:
-                if self.stop_twap(twap_id):
-                    count += 1
-            
-            self.logger.info(f"Stopped {count} TWAP executions")
-            return count
+            stopping = [(twap_id, twap) for twap_id, twap in self.active_twaps.items()
+                        if twap.stop(wait=False)]
+        
+        # Join outside the lock; the total wait is the slowest TWAP, not the sum
+        for twap_id, twap in stopping:
+            twap.join()
+            self.logger.info("Stopped TWAP %s", twap_id)
+        
+        with self.twap_lock:
+            for twap_id, twap in stopping:
+                self._complete_twap(twap_id, twap)
+                self.active_twaps.pop(twap_id, None)
+        
+        count = len(stopping)
+        self.logger.info("Stopped %s TWAP executions", count)
+        return count
 
     # Add methods to OrderHandler class
     OrderHandler.__init_twap_if_needed = __init_twap_if_needed
+    OrderHandler._complete_twap = _complete_twap
     OrderHandler.create_twap = create_twap
     OrderHandler.start_twap = start_twap
     OrderHandler.stop_twap = stop_twap
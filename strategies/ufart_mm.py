@@ -109,6 +109,7 @@ class UfartMarketMaking(TradingStrategy):
         self.last_cancel_time = 0  # Track when we last cancelled all orders
         self.auto_cancel_thread = None
         self.auto_cancel_active = False
+        self.auto_cancel_event = threading.Event()  # Set to wake and stop the auto-cancel loop
         self.auto_cancel_interval = 15  # Default, can be set via param if desired
         
         # Extract asset name from symbol for balance lookup
@@ -401,6 +402,7 @@ class UfartMarketMaking(TradingStrategy):
         if not self.api_connector.exchange or not self.order_handler.exchange:
             self.set_status("Error: Exchange connection is not active. Please connect first.")
             self.logger.error(f"[Instance {self.instance_id}] Exchange connection not active when starting strategy")
+            self._stop_auto_cancel_all()
             self.running = False
             return
         
@@ -712,11 +714,17 @@ class UfartMarketMaking(TradingStrategy):
                 "error": str(e)
             }
 
+    def stop(self):
+        """Stop the strategy and wake the auto-cancel loop so it exits right away"""
+        super().stop()
+        self._stop_auto_cancel_all()
+
     def _trigger_auto_cancel_all(self):
         if not self.auto_cancel_active:
             self.logger.warning(f"[Instance {self.instance_id}] Triggering auto-cancel-all routine due to insufficient spot balance error.")
             self.order_handler.cancel_all_orders()
             self.auto_cancel_active = True
+            self.auto_cancel_event.clear()
             self.auto_cancel_thread = threading.Thread(target=self._auto_cancel_all_loop, daemon=True)
             self.auto_cancel_thread.start()
 
@@ -724,12 +732,11 @@ class UfartMarketMaking(TradingStrategy):
         while self.auto_cancel_active and self.running:
             self.logger.info(f"[Instance {self.instance_id}] [AutoCancel] Cancelling all orders every {self.auto_cancel_interval}s due to insufficient spot balance error.")
             self.order_handler.cancel_all_orders()
-            for _ in range(self.auto_cancel_interval * 10):
-                if not self.auto_cancel_active or not self.running:
-                    break
-                time.sleep(0.1)
+            if self.auto_cancel_event.wait(self.auto_cancel_interval):
+                break
 
     def _stop_auto_cancel_all(self):
         if self.auto_cancel_active:
             self.logger.info(f"[Instance {self.instance_id}] Stopping auto-cancel-all routine (order placed or strategy stopped).")
-            self.auto_cancel_active = False
\ No newline at end of file
+            self.auto_cancel_active = False
+            self.auto_cancel_event.set()
\ No newline at end of file
@@ -9,6 +9,8 @@ from datetime import datetime
 from typing import Dict, List, Any, Optional, Tuple
 import sys
 
+from utils import load_env
+
 class ElysiumTerminalUI(cmd.Cmd):
     """Command-line interface for MMMM Trading Platform"""
     
@@ -78,19 +80,20 @@ class ElysiumTerminalUI(cmd.Cmd):
         self.display_layout()
         print("\nInitializing MMMM CLI...")
         
-        # Auto-connect to mainnet
-        wallet_address = os.getenv('WALLET_ADDRESS')
-        secret_key = os.getenv('WALLET_SECRET')
-            
-        if wallet_address and secret_key:
+        # Reuse the connection made at startup, otherwise auto-connect to mainnet
+        env = load_env()
+        wallet_address = env.get('WALLET_ADDRESS')
+        secret_key = env.get('WALLET_SECRET')
+            
+        if self.api_connector.exchange:
+            print(f"Using existing connection for {self.api_connector.wallet_address}")
+        elif wallet_address and secret_key:
             print("\nConnecting to Hyperliquid mainnet...")
-            success = self.api_connector.connect_hyperliquid(wallet_address, secret_key, False)  # False for mainnet
-            if success:
+            connection = self.api_connector.connect_hyperliquid(wallet_address, secret_key, False)  # False for mainnet
+            if connection:
                 print(f"Successfully connected to {wallet_address}")
                 # Initialize order handler with the connected exchange and info objects
-                self.order_handler.exchange = self.api_connector.exchange
-                self.order_handler.info = self.api_connector.info
-                self.order_handler.wallet_address = wallet_address
+                self.order_handler.attach(connection)
             else:
                 print("Failed to connect to exchange")
                 sys.exit(1)
@@ -514,7 +517,7 @@ class ElysiumTerminalUI(cmd.Cmd):
             leverage = int(args[1])
             
             print(f"\nSetting {leverage}x leverage for {symbol}")
-            result = self.order_handler._set_leverage(symbol, leverage)
+            result = self.order_handler._set_leverage(symbol, leverage, force=True)
             
             if result["status"] == "ok":
                 print(f"Leverage for {symbol} set to {leverage}x")
@@ -787,10 +790,7 @@ class ElysiumTerminalUI(cmd.Cmd):
             strategy_name = arg.strip()
             
             # Check if strategy exists
-            strategies = self.strategy_selector.list_strategies()
-            strategy_exists = any(s['module'] == strategy_name for s in strategies)
-            
-            if not strategy_exists:
+            if strategy_name not in self.strategy_selector.strategies:
                 print(f"\nStrategy '{strategy_name}' not found.")
                 print("Use 'select_strategy' to see available strategies.")
                 return
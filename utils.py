@@ -1,31 +1,38 @@
 import os
-import sys
 import time
 import json
 import logging
+from collections import ChainMap
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional, Tuple
+from types import MappingProxyType
+from typing import Dict, List, Any, Optional, Tuple, Mapping
 
-def setup_logging(log_level: int = logging.INFO, log_file: Optional[str] = None) -> logging.Logger:
-    """Set up logging configuration"""
-    log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    
-    # Configure the root logger
-    logging.basicConfig(
-        level=log_level,
-        format=log_format,
-        handlers=[
-            logging.StreamHandler(sys.stdout)
-        ]
-    )
+from dotenv import dotenv_values, find_dotenv
+
+# Same lookup load_dotenv() did: walk up from this package, else expect .env beside it
+ENV_FILE = find_dotenv() or os.path.join(os.path.dirname(os.path.abspath(__file__)), ".env")
+
+# (path, mtime_ns, values) of the last parsed .env file
+_env_cache: Tuple[Optional[str], Optional[int], Mapping[str, Optional[str]]] = (None, None, MappingProxyType({}))
+
+def load_env(path: str = ENV_FILE) -> Mapping[str, Optional[str]]:
+    """
+    Get settings as a read-only mapping of the process environment over the .env file
     
-    # Add file handler if specified
-    if log_file:
-        file_handler = logging.FileHandler(log_file)
-        file_handler.setFormatter(logging.Formatter(log_format))
-        logging.getLogger().addHandler(file_handler)
+    The file is checked once per call and only re-parsed when it changes, so read
+    several settings from one returned mapping rather than calling this per key.
+    """
+    global _env_cache
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        mtime = None
     
-    return logging.getLogger("elysium")
+    if _env_cache[:2] != (path, mtime):
+        values = dotenv_values(path) if mtime is not None else {}
+        _env_cache = (path, mtime, MappingProxyType(values))
+    # Exported variables win over the file, as they did with load_dotenv()
+    return MappingProxyType(ChainMap(os.environ, _env_cache[2]))
 
 def format_number(number: float, decimal_places: int = 2) -> str:
     """Format a number with the specified decimal places"""